@@ -1,6 +1,25 @@
 import os
-import json
+import orjson
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+# entity type -> {name: local_id} mapping file in the id mapping directory
+ENTITY_ID_MAP_FILES = {
+    'company': 'company2id.json',
+    'stock_symbol': 'stocksymbol2id.json',
+    'industry': 'industry2id.json',
+    'sector': 'sector2id.json',
+    'institution': 'institution2id.json',
+    'fund': 'mutualfund2id.json',
+    'fund_symbol': 'fundsymbol2id.json',
+}
+
+# 1MB write buffer for the (large) HAKE text files instead of the default ~8KB
+WRITE_BUFFER_SIZE = 1 << 20
+
+def load_json(filepath):
+    with open(filepath, 'rb') as f:
+        return orjson.loads(f.read())
 
 def invert_nested_dict(nested_dict):
     """
@@ -15,81 +34,82 @@ def invert_nested_dict(nested_dict):
 def invert_dict(dict_):
     return {v: k for k, v in dict_.items()}
 
+def build_name_table(local_id, id_dict_map):
+    """
+    Resolves every global id to its entity name once, so that triples
+    can be converted with a single dict lookup per endpoint.
+    
+    Input: {entity: {global_id: local_id}}, {entity: {local_id: name}}
+    Output: {global_id: name}
+    """
+    name_table = {}
+    for entity, inner_d in local_id.items():
+        names = id_dict_map[entity]
+        for g, l in inner_d.items():
+            if l in names:
+                name_table[g] = names[l]
+    return name_table
+
 def make_hake_triples(id_mapping_dir, edge_index_dir):
     """
     Prepare triples input: list of (head, relation, tail) for making hake dataset
     """
     # os.makedirs(out_dir, exist_ok=True)
     
+    ########### load all mapping files concurrently (independent I/O + parsing) ##########
+    paths = {
+        'global_triples': os.path.join(edge_index_dir, 'global_triples.json'),
+        'global_type': os.path.join(id_mapping_dir, 'global_type_map.json'),
+        'global_id': os.path.join(id_mapping_dir, 'global_id.json'),
+        **{entity: os.path.join(id_mapping_dir, filename)
+           for entity, filename in ENTITY_ID_MAP_FILES.items()},
+    }
+    with ThreadPoolExecutor(max_workers=len(paths)) as ex:
+        loaded = dict(zip(paths, ex.map(load_json, paths.values())))
+
     ########### get global triples ##########
-    with open(os.path.join(edge_index_dir, 'global_triples.json')) as f:
-        global_triples = json.load(f)
+    global_triples = loaded['global_triples']
 
     ############ get global entity type mapping ###########
-    with open(os.path.join(id_mapping_dir, 'global_type_map.json')) as f:
-        global_type = json.load(f)
+    global_type = loaded['global_type']
 
     ########## get local to global id mapping ############
-    with open(os.path.join(id_mapping_dir, 'global_id.json')) as f:
-        global_id = json.load(f)
+    global_id = loaded['global_id']
 
     # convert to global to local id mapping
     local_id = invert_nested_dict(global_id)
 
     ########### grab entity id mappings ###################
-    with open(os.path.join(id_mapping_dir, 'company2id.json')) as f:
-        company2id = json.load(f)
-    
-    with open(os.path.join(id_mapping_dir, 'stocksymbol2id.json')) as f:
-        stocksymbol2id = json.load(f)
-    
-    with open(os.path.join(id_mapping_dir, 'industry2id.json')) as f:
-        industry2id = json.load(f)
-    
-    with open(os.path.join(id_mapping_dir, 'sector2id.json')) as f:
-        sector2id = json.load(f)
-    
-    with open(os.path.join(id_mapping_dir, 'institution2id.json')) as f:
-        institution2id = json.load(f)
-    
-    with open(os.path.join(id_mapping_dir, 'mutualfund2id.json')) as f:
-        fund2id = json.load(f)
-    
-    with open(os.path.join(id_mapping_dir, 'fundsymbol2id.json')) as f:
-        fundsymbol2id = json.load(f)
-
-    id_dict_map = {
-        'company': invert_dict(company2id), 
-        'stock_symbol': invert_dict(stocksymbol2id), 
-        'industry': invert_dict(industry2id), 
-        'sector': invert_dict(sector2id),
-        'institution': invert_dict(institution2id), 
-        'fund': invert_dict(fund2id), 
-        'fund_symbol': invert_dict(fundsymbol2id),
-    }
+    id_dict_map = {entity: invert_dict(loaded[entity]) for entity in ENTITY_ID_MAP_FILES}
+
+    # JSON stringifies int keys: convert them back once here so the
+    # per-triple loop below needs no str()/int() casts
+    global_type = {int(k): v for k, v in global_type.items()}
+    local_id = {entity: {int(g): int(l) for g, l in inner_d.items()}
+                for entity, inner_d in local_id.items()}
+
+    # global id -> entity name, resolved once per entity
+    name_get = build_name_table(local_id, id_dict_map).get
 
     hake_triples = []
     # entity2id = {}
     # rel2id = {}
 
     for (h, r, t) in global_triples:
-        h_type_ = global_type[str(h)]
-        t_type_ = global_type[str(t)]
-        
-        # get local ids of h and t w.r.t their entity type
-        h_local_ = local_id[h_type_][h]
-        t_local_ = local_id[t_type_][t]
-        try:
-            # get name of h and t using their local ids
-            h_name = id_dict_map[h_type_][int(h_local_)]
-            t_name = id_dict_map[t_type_][int(t_local_)]
-    
-            hake_triples.append((h_name, r, t_name))
-        except KeyError:
+        h_name = name_get(h)
+        t_name = name_get(t)
+        if h_name is None or t_name is None:
+            h_type_ = global_type[h]
+            t_type_ = global_type[t]
+            # get local ids of h and t w.r.t their entity type
+            h_local_ = local_id[h_type_][h]
+            t_local_ = local_id[t_type_][t]
             print(f"Head node: Type {h_type_}, local id: {h_local_}")
             print(f"Tail node: Type {t_type_}, local id: {t_local_}")
             return
 
+        hake_triples.append((h_name, r, t_name))
+
     return hake_triples
     
 
@@ -123,18 +143,15 @@ def make_hake_dataset(triples, out_dir):
     rel2id = {r: i for i, r in enumerate(relation_list)}
 
     # ---- 2. Write entities.dict ----
-    with open(os.path.join(out_dir, "entities.dict"), "w", encoding="utf-8") as f:
-        for entity, eid in entity2id.items():
-            f.write(f"{eid}\t{entity}\n")
+    with open(os.path.join(out_dir, "entities.dict"), "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(f"{eid}\t{entity}\n" for entity, eid in entity2id.items())
 
     # ---- 3. Write relations.dict ----
-    with open(os.path.join(out_dir, "relations.dict"), "w", encoding="utf-8") as f:
-        for rel, rid in rel2id.items():
-            f.write(f"{rid}\t{rel}\n")
+    with open(os.path.join(out_dir, "relations.dict"), "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(f"{rid}\t{rel}\n" for rel, rid in rel2id.items())
 
     # ---- 4. Write train.txt (HAKE format uses names, not IDs) ----
-    with open(os.path.join(out_dir, "train.txt"), "w", encoding="utf-8") as f:
-        for h, r, t in triples:
-            f.write(f"{h}\t{r}\t{t}\n")
+    with open(os.path.join(out_dir, "train.txt"), "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(f"{h}\t{r}\t{t}\n" for h, r, t in triples)
 
     return
\ No newline at end of file
@@ -1,8 +1,38 @@
 from typing import *
 from torch_geometric.data import HeteroData
+import numpy as np
 import torch
+import os
 from collections import defaultdict
 
+
+def save_edge_index_npy(tensor_path):
+    """
+    One-time migration: store a saved edge index tensor (.pt) next to it as .npy,
+    so load_edge_index can memory-map it instead of unpickling.
+
+    Returns:
+    - path of the written .npy file
+    """
+    npy_path = os.path.splitext(tensor_path)[0] + '.npy'
+    np.save(npy_path, torch.load(tensor_path, weights_only=False).cpu().numpy())
+    return npy_path
+
+
+def load_edge_index(tensor_path):
+    """
+    Load a [2, num_edges] edge index saved with torch.save.
+    Uses the memory-mapped .npy copy (see save_edge_index_npy) when there is one,
+    otherwise falls back to torch.load.
+
+    Returns:
+    - np.ndarray (read-only memmap) or torch.LongTensor of shape [2, num_edges]
+    """
+    npy_path = os.path.splitext(tensor_path)[0] + '.npy'
+    if os.path.exists(npy_path):
+        return np.load(npy_path, mmap_mode='r')
+    return torch.load(tensor_path, weights_only=False)
+
 def build_global_id_map(entity_id_maps, entity_types):
     """
     entity_id_maps: list of dicts [{local_name: local_id}, ...]
@@ -36,12 +66,99 @@ def build_global_id_map(entity_id_maps, entity_types):
     return global_id_map, type_map, offsets
 
 
+def _remap_edge_index(rel, entity2global, offsets=None):
+    """
+    Map the local [2, num_edges] edge index of one relation dict
+    (see build_global_triples) to int64 arrays of global head / tail ids.
+    Duplicate edges are dropped, keeping the first occurrence.
+    """
+    edge_index = rel["edge_index"]  # [2, num_edges]
+    if isinstance(edge_index, torch.Tensor):
+        edge_index = edge_index.cpu().numpy()
+    edge_index = np.asarray(edge_index, dtype=np.int64)
+
+    hs, ts = edge_index
+
+    # de-duplicate (head, tail) pairs via a single int64 key per edge (much faster than
+    # np.unique(axis=1)); sorting the first-occurrence indices keeps edge order
+    _, first = np.unique(hs * (int(ts.max(initial=0)) + 1) + ts, return_index=True)
+    first.sort()
+    hs, ts = hs[first], ts[first]
+
+    if offsets is not None:
+        # build_global_id_map assigns global_id = offset + local_id: a single vector add
+        return hs + offsets[rel["head_type"]], ts + offsets[rel["tail_type"]]
+
+    # local_id -> global_id maps loaded from JSON have str keys: convert once
+    h_map = {int(k): v for k, v in entity2global[rel["head_type"]].items()}
+    t_map = {int(k): v for k, v in entity2global[rel["tail_type"]].items()}
+
+    return (np.array([h_map[h] for h in hs.tolist()], dtype=np.int64),
+            np.array([t_map[t] for t in ts.tolist()], dtype=np.int64))
+
+
+def build_global_triples_soa(
+    edge_indices_list: List[Dict],
+    entity2global: Dict[str, Dict[int, int]],
+    offsets: Optional[Dict[str, int]] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Convert local edge indices of multiple relation types to global triples,
+    stored as three parallel arrays (struct of arrays) instead of a list of tuples.
+    
+    Parameters:
+    - edge_indices_list, entity2global, offsets: as in build_global_triples
+    
+    Returns:
+    - heads: np.int64 array of global head ids
+    - rels: np.int32 array of relation ids (index into rel_names)
+    - tails: np.int64 array of global tail ids
+    - rel_names: list of relation type strings
+    """
+    rel_names = []
+    rel_ids = {}
+    heads, rels, tails = [], [], []
+    
+    for rel in edge_indices_list:
+        relation = rel["relation"]
+        head_type = rel["head_type"]
+        tail_type = rel["tail_type"]
+
+        print(f"Building global triples for ({head_type} {relation} {tail_type})")
+        
+        # Convert local IDs to global IDs
+        h_global, t_global = _remap_edge_index(rel, entity2global, offsets)
+        if relation not in rel_ids:
+            rel_ids[relation] = len(rel_names)
+            rel_names.append(relation)
+
+        heads.append(h_global)
+        rels.append(np.full(len(h_global), rel_ids[relation], dtype=np.int32))
+        tails.append(t_global)
+    
+    return (np.concatenate(heads or [np.empty(0, dtype=np.int64)]),
+            np.concatenate(rels or [np.empty(0, dtype=np.int32)]),
+            np.concatenate(tails or [np.empty(0, dtype=np.int64)]),
+            rel_names)
+
+
+def soa_to_triples(heads, rels, tails, rel_names):
+    """
+    Materialise struct-of-arrays triples (see build_global_triples_soa) as
+    List of triples: (global_head_id, relation_type_str, global_tail_id), e.g. to store as JSON
+    """
+    return list(zip(heads.tolist(), [rel_names[r] for r in rels.tolist()], tails.tolist()))
+
+
 def build_global_triples(
     edge_indices_list: List[Dict],
-    entity2global: Dict[str, Dict[int, int]]
+    entity2global: Dict[str, Dict[int, int]],
+    offsets: Optional[Dict[str, int]] = None
     ) -> List[Tuple[int, str, int]]:
     """
     Convert local edge indices (PyTorch tensors) of multiple relation types to global triples.
+    Only needed when the triples themselves are wanted (e.g. to store as JSON):
+    use build_hetero_graph_from_edges to go straight to a HeteroData object.
     
     Parameters:
     - edge_indices_list: list of dicts, each with:
@@ -49,53 +166,120 @@ def build_global_triples(
             "relation": str,
             "head_type": str,
             "tail_type": str,
-            "edge_index": torch.LongTensor of shape [2, num_edges] (head, tail)
+            "edge_index": torch.LongTensor or np.ndarray of shape [2, num_edges] (head, tail),
+                          e.g. from load_edge_index
         }
     - entity2global: dict mapping entity type -> local_id -> global_id
+    - offsets: optional dict mapping entity type -> offset_start (from build_global_id_map);
+        when given, global ids are computed as offset + local_id instead of looked up
     
     Returns:
-    - List of triples: (global_head_id, relation_type_str, global_tail_id)
+    - List of triples: (global_head_id, relation_type_str, global_tail_id), without duplicates
+    """
+    return soa_to_triples(*build_global_triples_soa(edge_indices_list, entity2global, offsets))
+
+
+def build_hetero_graph_soa(heads, rels, tails, rel_names, type_map):
     """
-    global_triples = []
+    heads, rels, tails, rel_names: struct-of-arrays triples, see build_global_triples_soa
+    type_map: dict {global_id: entity_type} (int keys, or str keys when loaded from JSON)
     
-    for rel in edge_indices_list:
-        relation = rel["relation"]
-        head_type = rel["head_type"]
-        tail_type = rel["tail_type"]
-        edge_index = rel["edge_index"]  # [2, num_edges]
+    Returns:
+    - HeteroData object
+    """
+    # dense global_id -> entity type code table, so types are looked up by array indexing
+    type_names = list(dict.fromkeys(type_map.values()))
+    type_codes = {name: i for i, name in enumerate(type_names)}
+    ids = np.fromiter((int(k) for k in type_map), dtype=np.int64, count=len(type_map))
+    codes = np.fromiter((type_codes[v] for v in type_map.values()), dtype=np.int64, count=len(type_map))
+    # (the extra last slot stays -1 and catches ids outside the table)
+    type_of = np.full(int(ids.max(initial=-1)) + 2, -1, dtype=np.int64)
+    type_of[ids] = codes
+    slot = lambda x: np.where((x >= 0) & (x < len(type_of)), x, len(type_of) - 1)
 
-        print(f"Building global triples for ({head_type} {relation} {tail_type})")
-        
-        # Convert local IDs to global IDs
-        h_global = [entity2global[head_type][str(h.item())] for h in edge_index[0]]
-        t_global = [entity2global[tail_type][str(t.item())] for t in edge_index[1]]
-        
-        # Append triples
-        global_triples.extend([(h, relation, t) for h, t in zip(h_global, t_global)])
+    h_types = type_of[slot(heads)]
+    t_types = type_of[slot(tails)]
+    if (h_types < 0).any() or (t_types < 0).any():
+        missing = np.concatenate([heads[h_types < 0], tails[t_types < 0]])
+        raise KeyError(f"global ids missing from type_map: {missing[:10].tolist()}")
+
+    # one key per (head_type, relation, tail_type) group
+    n_types, n_rels = len(type_names), len(rel_names)
+    group = (h_types * n_rels + rels) * n_types + t_types
+
+    # stable sort keeps the original edge order inside each group
+    perm = np.argsort(group, kind="stable")
+    keys, starts = np.unique(group[perm], return_index=True)
+    ends = np.append(starts[1:], len(perm))
+    
+    data = HeteroData()
     
-    return global_triples
+    # Add edges per relation, in order of first appearance
+    for i in np.argsort(perm[starts], kind="stable"):
+        h_type, rest = divmod(int(keys[i]), n_rels * n_types)
+        rel, t_type = divmod(rest, n_types)
+        idx = perm[starts[i]:ends[i]]
+        edges = torch.from_numpy(np.stack([heads[idx], tails[idx]]))  # shape [2, num_edges]
+        data[type_names[h_type], rel_names[rel], type_names[t_type]].edge_index = edges
+    
+    return data
 
 
 def build_hetero_graph(global_triples, type_map):
     """
     global_triples: List of (head_id, relation, tail_id)
-    type_map: dict {global_id: entity_type}
+    type_map: dict {global_id: entity_type} (int keys, or str keys when loaded from JSON)
+    
+    Returns:
+    - HeteroData object
+    """
+    # convert to struct of arrays once, then group edges with vectorised numpy ops
+    rel_names = list(dict.fromkeys(r for _, r, _ in global_triples))
+    rel_ids = {r: i for i, r in enumerate(rel_names)}
+    n = len(global_triples)
+    heads = np.fromiter((h for h, _, _ in global_triples), dtype=np.int64, count=n)
+    rels = np.fromiter((rel_ids[r] for _, r, _ in global_triples), dtype=np.int32, count=n)
+    tails = np.fromiter((t for _, _, t in global_triples), dtype=np.int64, count=n)
+    
+    return build_hetero_graph_soa(heads, rels, tails, rel_names, type_map)
+
+
+def build_hetero_graph_from_edges(
+    edge_indices_list: List[Dict],
+    entity2global: Dict[str, Dict[int, int]],
+    offsets: Optional[Dict[str, int]] = None
+    ) -> HeteroData:
+    """
+    Same result as build_hetero_graph(build_global_triples(...), type_map), but
+    remaps each local edge index straight into its (head_type, relation, tail_type)
+    group, without materialising the intermediate global triples.
+    
+    Parameters:
+    - edge_indices_list: list of relation dicts, as in build_global_triples
+    - entity2global: dict mapping entity type -> local_id -> global_id
+    - offsets: optional dict mapping entity type -> offset_start, as in build_global_triples
     
     Returns:
     - HeteroData object
     """
-    # Group edges by (head_type, relation, tail_type)
     edge_dict = defaultdict(list)
-    for h, r, t in global_triples:
-        head_type = type_map[str(h)]
-        tail_type = type_map[str(t)]
-        edge_dict[(head_type, r, tail_type)].append((h, t))
+    
+    for rel in edge_indices_list:
+        relation = rel["relation"]
+        head_type = rel["head_type"]
+        tail_type = rel["tail_type"]
+
+        print(f"Adding edges for ({head_type} {relation} {tail_type})")
+
+        edge_dict[(head_type, relation, tail_type)].append(
+            np.stack(_remap_edge_index(rel, entity2global, offsets))
+        )
     
     data = HeteroData()
     
     # Add edges per relation
-    for (src_type, rel, dst_type), edges in edge_dict.items():
-        edges = torch.tensor(edges, dtype=torch.long).t().contiguous()  # shape [2, num_edges]
+    for (src_type, rel, dst_type), chunks in edge_dict.items():
+        edges = torch.from_numpy(np.concatenate(chunks, axis=1))  # shape [2, num_edges]
         data[src_type, rel, dst_type].edge_index = edges
     
     return data
@@ -4,7 +4,9 @@ import re
 import numpy as np
 import ast
 import datetime
+import orjson
 import pandas as pd
+from functools import lru_cache
 
 
 TITLE_PREFIX_PATTERN = re.compile(
@@ -12,10 +14,15 @@ TITLE_PREFIX_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+@lru_cache(maxsize=100_000)
+def _clean_name_str(name: str) -> str:
+    # officer names repeat across companies, so cache the cleaned form
+    return TITLE_PREFIX_PATTERN.sub("", name).strip().lower()
+
 def clean_name(name):
     if not isinstance(name, str):
         return name
-    return TITLE_PREFIX_PATTERN.sub("", name).strip().lower()
+    return _clean_name_str(name)
 
 
 def extract_officer_names(arr):
@@ -34,6 +41,12 @@ def extract_officer_names(arr):
     return results
 
 
+# maps Python-style single quotes to JSON double quotes
+_QUOTE_TBL = str.maketrans({"'": '"'})
+
+# Pandas Timestamp('...') inside stringified holder lists
+_TIMESTAMP_RE = re.compile(r"Timestamp\('([^']+)'\)")
+
 def parse_list(cell):
     """
     Parse a cell from the raw string format into
@@ -60,9 +73,14 @@ def parse_list(cell):
         cleaned = cleaned[2:-2]
 
     # Replace Pandas Timestamp('...') → '...'
-    cleaned = re.sub(r"Timestamp\('([^']+)'\)", r"'\1'", cleaned)
+    cleaned = _TIMESTAMP_RE.sub(r"'\1'", cleaned)
 
-    # Try literal_eval
+    # Try orjson on the quote-normalised string first, then literal_eval for
+    # anything that is not valid JSON (None, nan, quotes inside names, ...)
+    try:
+        return orjson.loads(cleaned.translate(_QUOTE_TBL))  # returns a list of dicts
+    except orjson.JSONDecodeError:
+        pass
     try:
         parsed = ast.literal_eval(cleaned)
         return parsed  # returns a list of dicts
@@ -85,30 +103,35 @@ def extract_institution_names(arr):
     return results
 
 
+# Regex: capture before-first-hyphen as group 1, after-first-hyphen as group 2
+_HYPHEN_RE = re.compile(r'^([^-]*)-(.*)')
+
+# words dropped from T.Rowe Price fund names
+_TROWE_REMOVE_WORDS = frozenset({'Markets', 'Trust', 'Fund', 'Stock', 'Fd.', 'Equity'})
+
+# fund-family prefixes with their own renaming rule: prefix -> fn(text, after)
+_HYPHEN_PREFIX_DISPATCH = {
+    "Bridgeway Funds, Inc.": lambda text, after: f"Bridgeway {after}",
+    "TIAA-CREF Funds": lambda text, after: after.replace('CREF Funds-', ''),
+    "SPDR SERIES TRUST": lambda text, after: after.replace('(R)', ''),
+    "DFA INVESTMENT DIMENSIONS GROUP INC": lambda text, after: text,
+}
+
 def after_first_hyphen(text):
-    # Regex: capture before-first-hyphen as group 1, after-first-hyphen as group 2
-    match = re.search(r'^([^-]*)-(.*)', text)
+    match = _HYPHEN_RE.match(text)
     if not match:
         return text
 
     before = match.group(1).strip()
     after = match.group(2).strip()
 
-    # Condition: if the prefix is exactly "Bridgeway Funds, Inc."
-    if before == "Bridgeway Funds, Inc.":
-        return f"Bridgeway {after}"
-    elif before == 'TIAA-CREF Funds':
-        return f"{after.replace('CREF Funds-', '')}"
-    elif before == 'SPDR SERIES TRUST':
-        return f"{after.replace('(R)', '')}"
-    elif before == 'DFA INVESTMENT DIMENSIONS GROUP INC':
-        return text
-    elif after.startswith('Price (T.Rowe)'):
-        remove_words = ['Markets', 'Trust', 'Fund', 'Stock', 'Fd.', 'Equity']
-        after = ' '.join(word for word in after.split() if word not in remove_words)
-        return f"T.Rowe Price {after.strip()}"
-    else:
-        return after
+    rename = _HYPHEN_PREFIX_DISPATCH.get(before)
+    if rename is not None:
+        return rename(text, after)
+    if after.startswith('Price (T.Rowe)'):
+        after = ' '.join(word for word in after.split() if word not in _TROWE_REMOVE_WORDS)
+        return f"T.Rowe Price {after}"
+    return after
 
 
 def extract_mutualfund_names(arr):